@@ -1,78 +1,75 @@
-import importlib
-from textual.app import App, ComposeResult
-from textual.containers import Horizontal, HorizontalGroup, VerticalGroup, Center
-from textual.widgets import Button, Footer, Header, ProgressBar, RichLog
 import argparse
-import pyperclip
+import json
+import sys
+import time
+
+from solutions.core.arguments import day_arg, days_arg, parts_arg
 
 
 parser = argparse.ArgumentParser(
     prog='AoC 2024',
     description='Runs solutions for Advent of Code 2024'
 )
-parser.add_argument('day', type=int, choices=range(1, 26))
-parser.add_argument('part', type=int, choices=[1, 2])
+parser.add_argument('day', type=day_arg, nargs='?',
+                    help="Day to run, or 'all' to run every implemented day in parallel.")
+parser.add_argument('part', type=int, choices=[1, 2], nargs='?')
 parser.add_argument('-t', '--test', action='store_true',
                     help="Use to run on example/test file.")
+parser.add_argument('--headless', action='store_true',
+                    help="Run without the UI and print the result and timing as JSON.")
+parser.add_argument('--no-cache', action='store_true',
+                    help="Don't use cached answers or parsed inputs.")
+parser.add_argument('--refresh', action='store_true',
+                    help="Recompute answers even if cached, and store the new ones. "
+                         "Answers are only cached for --headless and batch runs.")
+parser.add_argument('--profile', action='store_true',
+                    help="Profile the run, writing .prof and collapsed-stack files to profiles/.")
+parser.add_argument('--timings', nargs='?', const='timings.jsonl', metavar='PATH',
+                    help="Trace memory and append per-phase timings to a JSON lines file (default: timings.jsonl).")
+parser.add_argument('--days', type=days_arg,
+                    help="Days to run in parallel, e.g. 1-15 or 1,3,5.")
+parser.add_argument('--parts', type=parts_arg,
+                    help="Parts to run for each day when running in parallel, e.g. 1,2.")
+parser.add_argument('-j', '--jobs', type=int,
+                    help="Number of worker processes for parallel runs (default: CPU count).")
 
 args = parser.parse_args()
+batch = args.day == 'all' or args.days is not None
+if not batch and (args.day is None or args.part is None):
+    parser.error("day and part are required unless running 'all' or --days")
 
-rich_log = RichLog(highlight=True, markup=True)
-progress_bar = ProgressBar(id="main_progress_bar")
-widget = None
-file = None
-
-class AoCApp(App):
-    CSS = """
-    .top_margin_1 {
-        margin-top: 1;
-    }
-    .width_auto { 
-        width: auto;
-    }
-    #main_progress_bar {
-        margin-top: 1;
-    }
-    .results_digits {
-        border: double green;
-        width: auto;
-    }
-    """
-    BINDINGS = [("d", "toggle_dark", "Toggle dark mode")]
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Footer()
-        with Horizontal():
-            yield widget
-            with VerticalGroup():
-                with HorizontalGroup():
-                    with Center():
-                        yield progress_bar
-                    yield Button("Run", id="run")
-                yield rich_log
-
-    def action_toggle_dark(self) -> None:
-        self.theme = (
-            "textual-dark" if self.theme == "textual-light" else "textual-light"
-        )
 
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "run":
-            widget.run(file, args.part, args.test)
-
-if __name__ == "__main__":
+def run_headless():
+    from solutions.core.runner import run_headless as run
     try:
-        day_str = str(args.day).rjust(2, "0")
-        module_name = f'solutions.day{day_str}'
-        module = importlib.import_module(module_name)
-        widget = getattr(module, f'Day{day_str}')(rich_log, progress_bar)
-        if widget:
-            input_file_name = f'inputs/day{day_str}{'-test' if args.test else ''}.txt'
-            file = open(input_file_name, 'r')
+        record = run(args.day, args.part, args.test, not args.no_cache, args.refresh, args.profile, args.timings)
+        if args.profile:
+            print('\n'.join(record['profile'].pop('top')), file=sys.stderr)
+        print(json.dumps(record))
     except ModuleNotFoundError:
-        print(f'No implementation for day {args.day} found.')
+        print(f'No implementation for day {args.day} found.', file=sys.stderr)
+        sys.exit(1)
     except OSError:
-        print(f'Input file for day {args.day} {'(test) ' if args.test else ''}not found.')
+        print(f"Input file for day {args.day} {'(test) ' if args.test else ''}not found.", file=sys.stderr)
+        sys.exit(1)
 
-    app = AoCApp()
-    app.run()
+
+def run_batch():
+    from solutions.core.runner import format_table, implemented_days, run_batch as run
+    days = args.days or implemented_days()
+    parts = args.parts or ([args.part] if args.part else [1, 2])
+    start = time.perf_counter()
+    results = run(days, parts, args.test, args.jobs, not args.no_cache, args.refresh, args.profile, args.timings)
+    print(format_table(results, time.perf_counter() - start))
+    if any('error' in r for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if batch:
+        run_batch()
+    elif args.headless:
+        run_headless()
+    else:
+        from tui import run_tui
+        run_tui(args)
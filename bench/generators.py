@@ -0,0 +1,207 @@
+import math
+import random
+
+
+# Synthetic puzzle inputs in the same format as the real ones. Each generator
+# takes a scale factor (1 is roughly the size of a real puzzle input) and a
+# seeded Random, and returns the input text without a trailing newline.
+
+
+def grid_side(base, scale):
+    return max(4, int(base * math.sqrt(scale)))
+
+
+def day01(scale, rng):
+    rows = 1000 * scale
+    return '\n'.join(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}" for _ in range(rows))
+
+
+def day02(scale, rng):
+    lines = []
+    for _ in range(1000 * scale):
+        value = rng.randint(1, 99)
+        direction = rng.choice([-1, 1])
+        levels = [value]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly valid steps, with the occasional bad one
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 6)
+            value += direction * step
+            levels.append(value)
+        lines.append(' '.join(str(x) for x in levels))
+    return '\n'.join(lines)
+
+
+def day03(scale, rng):
+    junk = "!@#$%^&*()[]{}<>,;:'? mulxdon't_select+-"
+    tokens = []
+    for _ in range(750 * scale):
+        roll = rng.random()
+        if roll < 0.7:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif roll < 0.8:
+            tokens.append("do()")
+        elif roll < 0.9:
+            tokens.append("don't()")
+        else:
+            tokens.append(f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})")
+        tokens.append(''.join(rng.choice(junk) for _ in range(rng.randint(0, 20))))
+    text = ''.join(tokens)
+    return '\n'.join(text[i:i + 3000] for i in range(0, len(text), 3000))
+
+
+def day04(scale, rng):
+    side = grid_side(140, scale)
+    return '\n'.join(''.join(rng.choice('XMAS') for _ in range(side)) for _ in range(side))
+
+
+def day05(scale, rng):
+    pages = rng.sample(range(10, 100), 49)
+    rules = []
+    # Every pair of pages is ordered, as in the real input
+    for i in range(len(pages)):
+        for j in range(i + 1, len(pages)):
+            rules.append(f"{pages[i]}|{pages[j]}")
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(str(x) for x in update))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates)
+
+
+def day06(scale, rng):
+    side = grid_side(130, scale)
+    grid = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+    grid[side // 2][side // 2] = '^'
+    return '\n'.join(''.join(row) for row in grid)
+
+
+def day07(scale, rng):
+    lines = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+':
+                target += number
+            elif op == '*':
+                target *= number
+            else:
+                target = int(f"{target}{number}")
+        if rng.random() < 0.5:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(str(x) for x in numbers)}")
+    return '\n'.join(lines)
+
+
+def day08(scale, rng):
+    side = grid_side(50, scale)
+    frequencies = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    grid = [['.' for _ in range(side)] for _ in range(side)]
+    for _ in range(200 * scale):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return '\n'.join(''.join(row) for row in grid)
+
+
+def day09(scale, rng):
+    digits = []
+    for i in range(20000 * scale - 1):
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    return ''.join(digits)
+
+
+def day10(scale, rng):
+    side = grid_side(50, scale)
+    offsets = [[rng.randint(0, 9) for _ in range(side // 4 + 1)] for _ in range(side // 4 + 1)]
+    return '\n'.join(
+        ''.join(str((row + col + offsets[row // 4][col // 4]) % 10) for col in range(side))
+        for row in range(side)
+    )
+
+
+def day11(scale, rng):
+    return ' '.join(str(rng.randint(0, 9_999_999)) for _ in range(8 * scale))
+
+
+def day12(scale, rng):
+    side = grid_side(140, scale)
+    patch = 6
+    patches = [[rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(side // patch + 1)] for _ in range(side // patch + 1)]
+    rows = []
+    for row in range(side):
+        cells = []
+        for col in range(side):
+            # Jitter the patch edges so regions aren't plain squares
+            jitter_row = min(max(row + rng.randint(-1, 1), 0), side - 1)
+            jitter_col = min(max(col + rng.randint(-1, 1), 0), side - 1)
+            cells.append(patches[jitter_row // patch][jitter_col // patch])
+        rows.append(''.join(cells))
+    return '\n'.join(rows)
+
+
+def day13(scale, rng):
+    machines = []
+    for _ in range(320 * scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        while ax * by == ay * bx:
+            # Parallel buttons have no unique solution, real inputs never have them
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        prize_x, prize_y = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.5:
+            prize_x += rng.randint(1, 50)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={prize_x}, Y={prize_y}")
+    return '\n\n'.join(machines)
+
+
+def day14(scale, rng):
+    width, height = 101, 103
+    robots = []
+    # Plant a filled block of robots at a random step so part 2 has something to find
+    tree_step = rng.randint(100, 9_000)
+    for dy in range(8):
+        for dx in range(8):
+            vel_x, vel_y = rng.randint(-99, 99), rng.randint(-99, 99)
+            pos_x = (40 + dx - vel_x * tree_step) % width
+            pos_y = (40 + dy - vel_y * tree_step) % height
+            robots.append(f"p={pos_x},{pos_y} v={vel_x},{vel_y}")
+    for _ in range(500 * scale - len(robots)):
+        robots.append(
+            f"p={rng.randrange(width)},{rng.randrange(height)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        )
+    rng.shuffle(robots)
+    return '\n'.join(robots)
+
+
+def day15(scale, rng):
+    side = grid_side(50, scale)
+    grid = []
+    for row in range(side):
+        cells = []
+        for col in range(side):
+            if row in (0, side - 1) or col in (0, side - 1):
+                cells.append('#')
+            else:
+                roll = rng.random()
+                cells.append('#' if roll < 0.08 else 'O' if roll < 0.4 else '.')
+        grid.append(cells)
+    grid[side // 2][side // 2] = '@'
+    moves = ''.join(rng.choice('<>^v') for _ in range(20000 * scale))
+    return (
+        '\n'.join(''.join(row) for row in grid) + '\n\n'
+        + '\n'.join(moves[i:i + 1000] for i in range(0, len(moves), 1000))
+    )
+
+
+generators = {
+    1: day01, 2: day02, 3: day03, 4: day04, 5: day05,
+    6: day06, 7: day07, 8: day08, 9: day09, 10: day10,
+    11: day11, 12: day12, 13: day13, 14: day14, 15: day15,
+}
+
+
+def generate(day, scale, seed=2024):
+    return generators[day](scale, random.Random(f"{seed}-{day}-{scale}"))
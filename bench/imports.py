@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from bench.run import find_regressions
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'imports-baseline.json')
+
+# Command lines to measure, and modules each one must not import
+scenarios = {
+    'help': (['aoc.py', '--help'], ['textual', 'rich', 'pyperclip']),
+    'headless': (['aoc.py', '1', '1', '-t', '--headless'], ['textual', 'rich', 'pyperclip']),
+    'tui': (['-c', 'import tui'], []),
+}
+
+
+def measure(argv):
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + argv,
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def top_level_total(imports):
+    # Nested imports are indented, their time is already in their parent's cumulative
+    return sum(cumulative for name, _, cumulative in imports if not name[1:].startswith(' ')) / 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m bench.imports',
+        description='Reports import time at startup for aoc.py and the TUI'
+    )
+    parser.add_argument('-n', '--reps', type=int, default=5,
+                        help="Runs per scenario; the median total is reported.")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Number of slowest imports to list per scenario.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="Baseline JSON file to compare against or save to.")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Save these timings as the new baseline instead of comparing.")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Fail when a total is this many times slower than the baseline.")
+    args = parser.parse_args()
+
+    results = {}
+    failed = False
+    for scenario, (argv, forbidden) in scenarios.items():
+        runs = [measure(argv) for _ in range(args.reps)]
+        results[scenario] = {'median': statistics.median(top_level_total(run) for run in runs)}
+        imports = runs[-1]
+        print(f"{scenario} ({' '.join(argv)}): {results[scenario]['median'] * 1000:.1f}ms, {len(imports)} modules")
+        for name, _, cumulative in sorted(imports, key=lambda x: -x[2])[:args.top]:
+            print(f"  {cumulative / 1000:8.1f}ms  {name.strip()}")
+        leaked = sorted({name.strip() for name, _, _ in imports if name.strip().split('.')[0] in forbidden})
+        if leaked:
+            failed = True
+            print(f"  FORBIDDEN imports: {', '.join(leaked)}", file=sys.stderr)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+        for key, before, after in find_regressions(results, baseline, args.threshold):
+            failed = True
+            print(f"REGRESSION {key}: {before * 1000:.1f}ms -> {after * 1000:.1f}ms", file=sys.stderr)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from bench.generators import generate, generators
+from solutions.core.puzzle_input import PuzzleInput
+from solutions.core.arguments import days_arg, input_file_name, parts_arg
+from solutions.core.runner import load_solver
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def time_run(day, part, path, test):
+    solver = load_solver(day)
+    with PuzzleInput(path) as puzzle_input:
+        start = time.perf_counter()
+        result = solver.run(puzzle_input, part, test)
+        return time.perf_counter() - start, result
+
+
+def bench(day, part, path, test, reps):
+    samples = []
+    result = None
+    for _ in range(reps):
+        elapsed, result = time_run(day, part, path, test)
+        samples.append(elapsed)
+    return {
+        'day': day,
+        'part': part,
+        'result': result,
+        'reps': reps,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 0.95),
+    }
+
+
+def bench_key(args, day, part):
+    source = f"x{args.scale}" if args.scale else 'test' if args.test else 'real'
+    return f"day{day:02d}-part{part}-{source}"
+
+
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for key, stats in results.items():
+        if key in baseline and stats['median'] > baseline[key]['median'] * threshold:
+            regressions.append((key, baseline[key]['median'], stats['median']))
+    return regressions
+
+
+def format_results(results):
+    rows = [('Benchmark', 'Reps', 'Min', 'Median', 'p95')]
+    for key, stats in results.items():
+        rows.append((key, str(stats['reps'])) + tuple(f"{stats[x] * 1000:.2f}ms" for x in ('min', 'median', 'p95')))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ['  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m bench.run',
+        description='Benchmarks Advent of Code 2024 solutions'
+    )
+    parser.add_argument('--days', type=days_arg, default=sorted(generators),
+                        help="Days to benchmark, e.g. 1-15 or 1,3,5.")
+    parser.add_argument('--parts', type=parts_arg, default=[1, 2],
+                        help="Parts to benchmark, e.g. 1,2.")
+    parser.add_argument('-n', '--reps', type=int, default=5,
+                        help="Repetitions per day and part.")
+    parser.add_argument('-t', '--test', action='store_true',
+                        help="Use the example/test files instead of the real inputs.")
+    parser.add_argument('--scale', type=int,
+                        help="Use synthetic inputs this many times the real input size, e.g. 10.")
+    parser.add_argument('--seed', type=int, default=2024,
+                        help="Seed for synthetic inputs.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="Baseline JSON file to compare against or save to.")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Save these timings as the new baseline instead of comparing.")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Fail when a median is this many times slower than the baseline.")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as input_dir:
+        for day in args.days:
+            if args.scale:
+                path = os.path.join(input_dir, f"day{day:02d}-x{args.scale}.txt")
+                with open(path, 'w') as input_file:
+                    input_file.write(generate(day, args.scale, args.seed))
+            else:
+                path = input_file_name(day, args.test)
+                if not os.path.exists(path):
+                    print(f"Skipping day {day}, {path} not found.", file=sys.stderr)
+                    continue
+            for part in args.parts:
+                key = bench_key(args, day, part)
+                results[key] = bench(day, part, path, args.test, args.reps)
+                print(f"{key}: {results[key]['median'] * 1000:.2f}ms", file=sys.stderr)
+
+    print(format_results(results))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before * 1000:.2f}ms -> {after * 1000:.2f}ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
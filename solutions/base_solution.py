@@ -1,18 +1,140 @@
+import time
+
 from textual import work
 from textual.containers import VerticalGroup
 from textual.widget import Widget
-from textual.widgets import RichLog, ProgressBar, Markdown
+from textual.widgets import Button, RichLog, ProgressBar, Markdown
+
+from solutions.core.base_solver import Instrumentation, Reporter
+from solutions.core.profiling import Profiler
+from solutions.core.puzzle_input import PuzzleInput
+
+
+class WidgetReporter(Reporter):
+    """Batches solver updates and pushes them to the widgets at most `rate`
+    times a second, so the solve loop doesn't cross into the UI thread on
+    every item."""
+
+    rate = 30
+
+    def __init__(self, solution, instrumentation):
+        self.solution = solution
+        self.instrumentation = instrumentation
+        self.next_flush = 0
+        self.pending_logs = []
+        self.pending_total = None
+        self.pending_advance = 0
+        self.pending_result = None
+        self.pending_frame = None
+
+    @property
+    def animated(self):
+        return not self.solution.fast_forward
+
+    def log(self, message):
+        self.pending_logs.append(message)
+        self.maybe_flush()
+
+    def total(self, total):
+        self.pending_total = total
+        self.pending_advance = 0
+        self.maybe_flush()
+
+    def advance(self, amount=1):
+        self.pending_advance += amount
+        self.maybe_flush()
+
+    def result(self, value):
+        self.pending_result = value
+        self.maybe_flush()
+
+    def frame(self, render):
+        if self.solution.grid_display is not None:
+            self.pending_frame = render
+            self.maybe_flush()
+
+    def pause(self, seconds):
+        if self.animated:
+            self.flush()
+            time.sleep(seconds)
+
+    def maybe_flush(self):
+        now = time.monotonic()
+        if now >= self.next_flush:
+            self.next_flush = now + 1 / self.rate
+            self.flush()
+
+    def flush(self):
+        logs, self.pending_logs = self.pending_logs, []
+        total, self.pending_total = self.pending_total, None
+        advance, self.pending_advance = self.pending_advance, 0
+        result, self.pending_result = self.pending_result, None
+        render, self.pending_frame = self.pending_frame, None
+        # Only the latest frame is drawn, so only it gets rendered
+        grid = None
+        if render is not None:
+            with self.instrumentation.span('render'):
+                grid = render()
+        self.solution.app.call_from_thread(self.apply, logs, total, advance, result, grid)
+
+    def apply(self, logs, total, advance, result, grid):
+        for message in logs:
+            self.solution.rich_log.write(message)
+        if total is not None:
+            self.solution.progress.update(total=total, progress=0)
+        if advance:
+            self.solution.progress.advance(advance)
+        if result is not None:
+            self.solution.digits.update(str(result))
+        if grid is not None:
+            self.solution.grid_display.update(grid)
 
 
 class BaseSolution(VerticalGroup):
+    # Widget-free solver (see solutions/core) that does the actual work
+    solver_class = None
+
     def __init__(self, rich_log: RichLog, progress: ProgressBar, *children: Widget):
         self.rich_log = rich_log
         self.progress = progress
+        self.digits = None
+        self.grid_display = None
+        self.fast_forward = False
+        self.parse_cache = None
+        self.profile = False
+        self.timings_path = None
         super().__init__(*children)
 
     def compose(self):
         yield Markdown("# UI NOT IMPLEMENTED")
 
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "copy":
+            # Imported on first use, it's only needed for the copy button
+            import pyperclip
+            pyperclip.copy(self.digits.value)
+
     @work(exclusive=True, thread=True)
-    async def run(self, input_file, part):
-        self.rich_log.write("[bold red]RUN NOT IMPLEMENTED[/bold red]")
\ No newline at end of file
+    async def run(self, input_path, part, test=False):
+        if self.solver_class is None:
+            self.rich_log.write("[bold red]RUN NOT IMPLEMENTED[/bold red]")
+            return
+        instrumentation = Instrumentation(trace_memory=bool(self.timings_path))
+        reporter = WidgetReporter(self, instrumentation)
+        solver = self.solver_class(reporter, self.parse_cache, instrumentation)
+        with PuzzleInput(input_path) as puzzle_input:
+            if self.profile:
+                with Profiler(f"{type(self).__name__.lower()}-part{part}") as profiler:
+                    result = solver.run(puzzle_input, part, test)
+                for line in profiler.top_functions():
+                    reporter.log(f"[dim]{line}[/dim]")
+                reporter.log(f"Profile written to {profiler.prof_path} and {profiler.collapsed_path}")
+            else:
+                result = solver.run(puzzle_input, part, test)
+        reporter.result(result)
+        for line in instrumentation.summary():
+            reporter.log(f"[dim]{line}[/dim]")
+        if self.timings_path:
+            instrumentation.write(self.timings_path, day=int(type(self).__name__.removeprefix('Day')), part=part, test=test)
+        reporter.log(f"[bold green]Done, Result:[/bold green] {result}")
+        reporter.flush()
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+
+DEFAULT_PATH = os.path.join('.aoc-cache', 'answers.sqlite3')
+
+
+def source_paths(solver):
+    # The solver's own module plus every shared core module (parsing, base solver, records...),
+    # but not the other days
+    core_dir = os.path.dirname(os.path.abspath(__file__))
+    shared = sorted(name for name in os.listdir(core_dir) if name.endswith('.py') and not name.startswith('day'))
+    return [sys.modules[type(solver).__module__].__file__] + [os.path.join(core_dir, name) for name in shared]
+
+
+def source_digest(solver):
+    # The answer depends on all of source_paths; editing any of them invalidates answers
+    digest = hashlib.sha256()
+    for path in source_paths(solver):
+        with open(path, 'rb') as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+class AnswerStore:
+    """SQLite store of computed answers, keyed by day, part, input hash and
+    the hash of the solver's source."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS answers (
+                day INTEGER NOT NULL,
+                part INTEGER NOT NULL,
+                test INTEGER NOT NULL,
+                input_hash TEXT NOT NULL,
+                source_hash TEXT NOT NULL,
+                result TEXT NOT NULL,
+                seconds REAL NOT NULL,
+                created REAL NOT NULL,
+                PRIMARY KEY (day, part, test, input_hash)
+            )
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, day, part, test, input_hash, source_hash):
+        row = self.connection.execute(
+            "SELECT result FROM answers "
+            "WHERE day = ? AND part = ? AND test = ? AND input_hash = ? AND source_hash = ?",
+            (day, part, test, input_hash, source_hash)
+        ).fetchone()
+        if row is None:
+            return False, None
+        # Results are stored as JSON, some answers don't fit in an SQLite integer
+        return True, json.loads(row[0])
+
+    def put(self, day, part, test, input_hash, source_hash, result, seconds):
+        with self.connection:
+            # Answers from an older version of this day's solver are stale
+            self.connection.execute(
+                "DELETE FROM answers WHERE day = ? AND source_hash != ?",
+                (day, source_hash)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (day, part, test, input_hash, source_hash, json.dumps(result), seconds, time.time())
+            )
@@ -0,0 +1,33 @@
+import argparse
+
+
+def day_str(day):
+    return str(day).rjust(2, "0")
+
+
+def input_file_name(day, test):
+    return f"inputs/day{day_str(day)}{'-test' if test else ''}.txt"
+
+
+def day_arg(value):
+    if value == 'all':
+        return value
+    day = int(value)
+    if not 1 <= day <= 25:
+        raise argparse.ArgumentTypeError(f"invalid day: {value}")
+    return day
+
+
+def days_arg(value):
+    days = []
+    for chunk in value.split(','):
+        first, _, last = chunk.partition('-')
+        days.extend(range(day_arg(first), day_arg(last or first) + 1))
+    return days
+
+
+def parts_arg(value):
+    parts = [int(x) for x in value.split(',')]
+    if any(part not in [1, 2] for part in parts):
+        raise argparse.ArgumentTypeError(f"invalid parts: {value}")
+    return parts
@@ -0,0 +1,123 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Reporter:
+    """Receives progress from a solver. This one discards everything, which is
+    what headless runs want; the TUI passes one that drives its widgets."""
+
+    # Whether the solver should spend time on animation frames and pauses
+    animated = False
+
+    def log(self, message):
+        pass
+
+    def total(self, total):
+        pass
+
+    def advance(self, amount=1):
+        pass
+
+    def result(self, value):
+        pass
+
+    def frame(self, render):
+        pass
+
+    def pause(self, seconds):
+        pass
+
+
+class Instrumentation:
+    """Times named phases of a run (parse, solve, render, or anything a solver
+    marks with `span`). Each phase accumulates wall time, CPU time of the
+    running thread and, with `trace_memory`, peak traced memory."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.open_spans = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def fold_peak(self):
+        # Peaks are reset per span, so push the current one into every open span first
+        _, peak = tracemalloc.get_traced_memory()
+        for span in self.open_spans:
+            span['peak'] = max(span['peak'], peak)
+
+    @contextmanager
+    def span(self, name):
+        span = {'peak': 0}
+        if self.trace_memory:
+            self.fold_peak()
+            tracemalloc.reset_peak()
+            span['start_memory'], _ = tracemalloc.get_traced_memory()
+        self.open_spans.append(span)
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            if self.trace_memory:
+                self.fold_peak()
+            self.open_spans.pop()
+            phase = self.phases.setdefault(name, {
+                'phase': name, 'count': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_bytes': None,
+            })
+            phase['count'] += 1
+            phase['wall_seconds'] += wall
+            phase['cpu_seconds'] += cpu
+            if self.trace_memory:
+                phase['peak_bytes'] = max(phase['peak_bytes'] or 0, span['peak'] - span['start_memory'])
+
+    def seconds(self, name):
+        return self.phases[name]['wall_seconds'] if name in self.phases else 0.0
+
+    def summary(self):
+        lines = [f"{'phase':<12} {'count':>7} {'wall':>10} {'cpu':>10} {'peak':>10}"]
+        for phase in self.phases.values():
+            peak = f"{phase['peak_bytes'] / 1024:8.0f}KB" if phase['peak_bytes'] is not None else '-'
+            lines.append(
+                f"{phase['phase']:<12} {phase['count']:>7} {phase['wall_seconds'] * 1000:8.1f}ms "
+                f"{phase['cpu_seconds'] * 1000:8.1f}ms {peak:>10}"
+            )
+        return lines
+
+    def write(self, path, **fields):
+        with open(path, 'a') as timings_file:
+            timings_file.write(json.dumps({**fields, 'time': time.time(), 'phases': list(self.phases.values())}) + '\n')
+
+
+class BaseSolver:
+    # Bump when parse() output changes, so cached parses are not reused
+    version = 1
+
+    def __init__(self, reporter=None, parse_cache=None, instrumentation=None):
+        self.reporter = reporter or Reporter()
+        self.parse_cache = parse_cache
+        self.instrumentation = instrumentation or Instrumentation()
+
+    def span(self, name):
+        return self.instrumentation.span(name)
+
+    def parse(self, puzzle_input):
+        return puzzle_input
+
+    def load(self, puzzle_input):
+        if self.parse_cache is None:
+            return self.parse(puzzle_input)
+        return self.parse_cache.load(self, puzzle_input)
+
+    def solve(self, data, part, test=False):
+        raise NotImplementedError
+
+    def run(self, puzzle_input, part, test=False):
+        with self.span('parse'):
+            data = self.load(puzzle_input)
+        with self.span('solve'):
+            return self.solve(data, part, test)
@@ -0,0 +1,31 @@
+from array import array
+from collections import Counter
+from operator import sub
+
+from solutions.core.base_solver import BaseSolver
+
+
+class Day01Solver(BaseSolver):
+    version = 2
+
+    def parse(self, puzzle_input):
+        self.reporter.log("Processing File...")
+        values = puzzle_input.text().split()
+        column1 = array('l', sorted(map(int, values[0::2])))
+        column2 = array('l', sorted(map(int, values[1::2])))
+        self.reporter.log(f"Loaded {len(column1)} sorted rows")
+        return column1, column2
+
+    def solve(self, data, part, test=False):
+        column1, column2 = data
+        self.reporter.log("Calculating...")
+        self.reporter.total(len(column1))
+        if part == 1:
+            result = sum(map(abs, map(sub, column1, column2)))
+        else:
+            # Count each value in the right column once instead of rescanning it per row
+            occurrences = Counter(column2)
+            result = sum(value * occurrences[value] for value in column1)
+        self.reporter.advance(len(column1))
+        self.reporter.result(result)
+        return result
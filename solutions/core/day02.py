@@ -0,0 +1,58 @@
+from array import array
+from operator import sub
+
+from solutions.core.base_solver import BaseSolver
+
+
+def step_mask(deltas, direction):
+    # One byte per delta, 1 where the step is 1-3 in the given direction
+    return bytes(1 <= delta * direction <= 3 for delta in deltas)
+
+
+def is_safe_without(values, skip, direction):
+    previous = None
+    for index, value in enumerate(values):
+        if index == skip:
+            continue
+        if previous is not None and not 1 <= (value - previous) * direction <= 3:
+            return False
+        previous = value
+    return True
+
+
+class Day02Solver(BaseSolver):
+    version = 2
+
+    def parse(self, puzzle_input):
+        # All reports back to back, with offsets[i]:offsets[i + 1] spanning report i
+        values = array('l')
+        offsets = array('l', [0])
+        for line in puzzle_input.iter_lines():
+            values.extend(map(int, line.split()))
+            offsets.append(len(values))
+        return values, offsets
+
+    def solve(self, data, part, test=False):
+        values, offsets = data
+        self.reporter.log("Calculating...")
+        self.reporter.total(len(offsets) - 1)
+
+        # Deltas across report boundaries are computed too, but never looked at
+        deltas = array('l', map(sub, values[1:], values))
+        masks = {direction: step_mask(deltas, direction) for direction in (1, -1)}
+
+        result = 0
+        for start, end in zip(offsets, offsets[1:]):
+            if any(0 not in mask[start:end - 1] for mask in masks.values()):
+                result += 1
+            elif part == 2:
+                # Whichever level is removed has to break up the first bad step
+                report = values[start:end]
+                for direction, mask in masks.items():
+                    bad = mask.find(0, start, end - 1) - start
+                    if is_safe_without(report, bad, direction) or is_safe_without(report, bad + 1, direction):
+                        result += 1
+                        break
+        self.reporter.advance(len(offsets) - 1)
+        self.reporter.result(result)
+        return result
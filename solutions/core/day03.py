@@ -0,0 +1,62 @@
+import re
+
+from solutions.core.base_solver import BaseSolver
+
+
+regex = re.compile(rb"(do)\(\)|(don't)\(\)|mul\((\d{1,3}),(\d{1,3})\)")
+
+CHUNK_SIZE = 1 << 20
+# Longest possible token, mul(123,456)
+MAX_TOKEN = 12
+
+
+def scan(buffer, cutoff, part, enabled):
+    """Adds up the enabled multiplications starting before `cutoff`. Returns the
+    sum, the enabled state and where the next scan has to pick up from."""
+    total = 0
+    count = 0
+    resume = 0
+    for match in regex.finditer(buffer):
+        if match.start() >= cutoff:
+            # Might be the start of a longer token in the next chunk
+            break
+        do, dont, left, right = match.groups()
+        if do:
+            enabled = enabled or part == 2
+        elif dont:
+            enabled = enabled and part != 2
+        elif enabled:
+            total += int(left) * int(right)
+            count += 1
+        resume = match.end()
+    return total, count, enabled, max(resume, cutoff, 0)
+
+
+class Day03Solver(BaseSolver):
+    def load(self, puzzle_input):
+        # Scanned straight from the file, there is nothing worth caching
+        return puzzle_input
+
+    def solve(self, puzzle_input, part, test=False):
+        result = 0
+        count = 0
+        enabled = True
+        self.reporter.log("Scanning for valid calls...")
+        self.reporter.total(len(puzzle_input.data))
+        # Everything before the last MAX_TOKEN - 1 bytes of a chunk is complete, the rest
+        # is carried over so tokens straddling chunks are still found
+        buffer = b''
+        for chunk in puzzle_input.iter_chunks(CHUNK_SIZE):
+            buffer += chunk
+            total, found, enabled, resume = scan(buffer, len(buffer) - MAX_TOKEN + 1, part, enabled)
+            buffer = buffer[resume:]
+            result += total
+            count += found
+            self.reporter.advance(len(chunk))
+            self.reporter.result(result)
+        total, found, enabled, _ = scan(buffer, len(buffer), part, enabled)
+        result += total
+        count += found
+        self.reporter.log(f"Added up {count} enabled multiplications")
+        self.reporter.result(result)
+        return result
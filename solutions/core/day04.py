@@ -0,0 +1,105 @@
+from solutions.core.base_solver import BaseSolver
+
+
+offsets = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+display_height = 20
+
+
+def render_grid(grid, start_row):
+    chunk = grid[start_row:start_row+display_height]
+    return "\n".join(["".join(row) for row in chunk])
+
+
+def word_stencils(word):
+    # The word read from its first letter in each of the 8 directions
+    return [[(row * i, col * i, letter) for i, letter in enumerate(word)] for row, col in offsets]
+
+
+def cross_stencils(word):
+    # Two copies of the word crossing diagonally at their middle letter, each read either way
+    middle = len(word) // 2
+    diagonals = []
+    for row, col in [(1, 1), (1, -1)]:
+        cells = [(row * (i - middle), col * (i - middle)) for i in range(len(word))]
+        diagonals.append([[(r, c, letter) for (r, c), letter in zip(cells, spelling)] for spelling in (word, word[::-1])])
+    return [down + up for down in diagonals[0] for up in diagonals[1]]
+
+
+class WordSearch:
+    """Counts stencils (lists of (row offset, column offset, letter)) over a
+    whole grid at once. Each letter becomes a big int with one byte per cell,
+    so a stencil is a handful of shifted ANDs. Rows are padded by `pad` cells
+    so horizontal offsets up to that size never wrap onto the next row."""
+
+    def __init__(self, rows, pad):
+        self.stride = len(rows[0]) + pad if rows else pad
+        self.cells = (b'\n' * pad).join(row.encode() for row in rows)
+        self.bitsets = {}
+
+    def bitset(self, letter):
+        if letter not in self.bitsets:
+            table = bytes(int(i == ord(letter)) for i in range(256))
+            self.bitsets[letter] = int.from_bytes(self.cells.translate(table), 'little')
+        return self.bitsets[letter]
+
+    def cell_offset(self, row, col):
+        return row * self.stride + col
+
+    def match(self, stencil):
+        # Byte p of the result is 1 when the stencil anchored at cell p matches
+        hits = -1
+        for row, col, letter in stencil:
+            shift = self.cell_offset(row, col) * 8
+            bits = self.bitset(letter)
+            hits &= bits >> shift if shift >= 0 else bits << -shift
+        return hits
+
+    def count(self, stencil):
+        return self.match(stencil).bit_count()
+
+    def anchors(self, hits):
+        data = hits.to_bytes((hits.bit_length() + 7) // 8, 'little')
+        index = data.find(1)
+        while index != -1:
+            yield index
+            index = data.find(1, index + 1)
+
+    def cells_of(self, anchor, stencil):
+        return [divmod(anchor + self.cell_offset(row, col), self.stride) for row, col, _ in stencil]
+
+
+class Day04Solver(BaseSolver):
+    word = "XMAS"
+    cross_word = "MAS"
+
+    def parse(self, puzzle_input):
+        return puzzle_input.grid().rows()
+
+    def solve(self, input, part, test=False):
+        stencils = word_stencils(self.word) if part == 1 else cross_stencils(self.cross_word)
+        pad = max([1] + [abs(col) for stencil in stencils for _, col, _ in stencil])
+        search = WordSearch(input, pad)
+
+        result = 0
+        result_grid = [['.' for _ in line] for line in input]
+        self.reporter.frame(lambda: render_grid(result_grid, 0))
+        self.reporter.total(len(stencils))
+        self.reporter.log("Searching...")
+        for stencil in stencils:
+            hits = search.match(stencil)
+            result += hits.bit_count()
+            if self.reporter.animated:
+                for anchor in search.anchors(hits):
+                    for (row, col), (_, _, letter) in zip(search.cells_of(anchor, stencil), stencil):
+                        result_grid[row][col] = letter
+                self.reporter.frame(lambda: render_grid(result_grid, 0))
+                self.reporter.pause(0.05)
+            self.reporter.advance()
+            self.reporter.result(result)
+
+        if self.reporter.animated:
+            # Scroll through everything that was found
+            for start_row in range(0, max(len(input) - display_height, 0) + 1, display_height // 2):
+                self.reporter.frame(lambda: render_grid(result_grid, start_row))
+                self.reporter.pause(0.05)
+        return result
@@ -0,0 +1,83 @@
+from collections import deque
+
+from solutions.core.base_solver import BaseSolver
+
+
+def bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def is_ordered(update, before):
+    # Breaking the rules means some page has a required predecessor right after it
+    return all(not before[a] >> b & 1 for a, b in zip(update, update[1:]))
+
+
+def topological_order(update, after, before):
+    # Kahn's algorithm over just the rules between this update's pages
+    mask = 0
+    for page in update:
+        mask |= 1 << page
+    waiting_on = {page: (before[page] & mask).bit_count() for page in update}
+    ready = deque(page for page in update if not waiting_on[page])
+    order = []
+    while ready:
+        page = ready.popleft()
+        order.append(page)
+        for successor in bits(after[page] & mask):
+            waiting_on[successor] -= 1
+            if not waiting_on[successor]:
+                ready.append(successor)
+    # Pages caught in a cycle keep their original order at the end
+    return order + [page for page in update if waiting_on[page]]
+
+
+class Day05Solver(BaseSolver):
+    version = 2
+
+    def parse(self, puzzle_input):
+        rules = []
+        updates = []
+
+        self.reporter.log("Loading input...")
+        reading_ordering_rules = True
+        for line in puzzle_input.iter_lines():
+            if line.strip() == "":
+                reading_ordering_rules = False
+            elif reading_ordering_rules:
+                rules.append([int(x) for x in line.split('|')])
+            else:
+                updates.append([int(x) for x in line.split(',')])
+
+        # after[page] and before[page] are bitsets of the pages that must come after or before it
+        page_count = max([page + 1 for rule in rules for page in rule] + [page + 1 for update in updates for page in update] + [0])
+        after = [0] * page_count
+        before = [0] * page_count
+        for first, second in rules:
+            after[first] |= 1 << second
+            before[second] |= 1 << first
+
+        return after, before, updates
+
+    def solve(self, data, part, test=False):
+        after, before, updates = data
+
+        self.reporter.log(f"Processing {len(updates)} updates...")
+        self.reporter.total(len(updates))
+        result = 0
+        for update in updates:
+            ordered = is_ordered(update, before)
+            if ordered:
+                self.reporter.log(f"[green]{update} is in order")
+            else:
+                self.reporter.log(f"[red]{update} is out of order")
+            if (part == 1 and ordered) or (part == 2 and not ordered):
+                sorted_update = update if ordered else topological_order(update, after, before)
+                middle_value = sorted_update[len(sorted_update) // 2]
+                result += middle_value
+                self.reporter.result(result)
+                self.reporter.pause(0.05)
+            self.reporter.advance()
+        return result
@@ -0,0 +1,239 @@
+import sys
+
+from solutions.core.base_solver import BaseSolver
+from solutions.core.parallel import process_pool, worker_count
+
+
+# North, east, south and west, in turning order
+offsets = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+
+def build_stops(grid):
+    """Jump tables, one per direction. stops[d][y * width + x] is the square the
+    guard stops on when walking in direction d from (x, y), or -1 if it walks
+    off the map."""
+    height = len(grid)
+    width = len(grid[0])
+    stops = [[-1] * (width * height) for _ in offsets]
+    for x in range(width):
+        last = -1
+        for y in range(height):
+            if grid[y][x] == '#':
+                last = y
+            elif last >= 0:
+                stops[0][y * width + x] = (last + 1) * width + x
+        last = -1
+        for y in range(height - 1, -1, -1):
+            if grid[y][x] == '#':
+                last = y
+            elif last >= 0:
+                stops[2][y * width + x] = (last - 1) * width + x
+    for y in range(height):
+        last = -1
+        for x in range(width - 1, -1, -1):
+            if grid[y][x] == '#':
+                last = x
+            elif last >= 0:
+                stops[1][y * width + x] = y * width + last - 1
+        last = -1
+        for x in range(width):
+            if grid[y][x] == '#':
+                last = x
+            elif last >= 0:
+                stops[3][y * width + x] = y * width + last + 1
+    return stops
+
+
+def next_stop(stops, width, x, y, facing, obstacle_x=-1, obstacle_y=-1):
+    # Patch the extra obstacle in when it is ahead of the guard and before the usual stop
+    stop = stops[facing][y * width + x]
+    if facing == 0:
+        if obstacle_x == x and obstacle_y < y and (stop < 0 or obstacle_y >= stop // width):
+            stop = (obstacle_y + 1) * width + x
+    elif facing == 1:
+        if obstacle_y == y and obstacle_x > x and (stop < 0 or obstacle_x <= stop % width):
+            stop = y * width + obstacle_x - 1
+    elif facing == 2:
+        if obstacle_x == x and obstacle_y > y and (stop < 0 or obstacle_y <= stop // width):
+            stop = (obstacle_y - 1) * width + x
+    elif obstacle_y == y and obstacle_x < x and (stop < 0 or obstacle_x >= stop % width):
+        stop = y * width + obstacle_x + 1
+    return stop
+
+
+def loops_with_obstacle(stops, width, x, y, facing, obstacle_x, obstacle_y):
+    # The guard only repeats itself if it repeats a turn, so those are all that's remembered
+    turns = set()
+    while True:
+        stop = next_stop(stops, width, x, y, facing, obstacle_x, obstacle_y)
+        if stop < 0:
+            return False
+        turn = stop * 4 + facing
+        if turn in turns:
+            return True
+        turns.add(turn)
+        y, x = divmod(stop, width)
+        facing = (facing + 1) % 4
+
+
+def render_grid(grid, visited_squares, center_x, center_y):
+    output_grid = []
+
+    if len(grid[0]) <= 20:
+        center_x = len(grid[0]) // 2
+    elif center_x < 10:
+        center_x = 10
+    elif center_x > len(grid[0]) - 10:
+        center_x = len(grid[0]) - 10
+
+    if len(grid) <= 20:
+        center_y = len(grid) // 2
+    elif center_y < 10:
+        center_y = 10
+    elif center_y > len(grid) - 10:
+        center_y = len(grid) - 10
+
+    min_x = max(center_x - 10, 0)
+    max_x = min(center_x + 10, len(grid[0]))
+    min_y = max(center_y - 10, 0)
+    max_y = min(center_y + 10, len(grid))
+
+    for y in range(min_y, max_y):
+        row = []
+        for x in range(min_x, max_x):
+            if (x, y) in visited_squares:
+                row.append('X')
+            else:
+                row.append(grid[y][x])
+        output_grid.append(row)
+
+    return "\n".join(["".join(row) for row in output_grid])
+
+
+def count_loops(shared_name, width, height, candidates):
+    """Process pool task. Counts the candidates, (x, y, previous_x, previous_y,
+    facing) as in Day06Solver.solve, that trap the guard in a loop. The grid is
+    read from shared memory rather than pickled into every task."""
+    from multiprocessing import shared_memory
+
+    shared = shared_memory.SharedMemory(name=shared_name)
+    try:
+        grid = [bytes(shared.buf[y * width:(y + 1) * width]).decode() for y in range(height)]
+    finally:
+        shared.close()
+    stops = build_stops(grid)
+    return sum(loops_with_obstacle(stops, width, previous_x, previous_y, facing, x, y)
+               for x, y, previous_x, previous_y, facing in candidates)
+
+
+class Day06Solver(BaseSolver):
+    # Candidate obstacles needed before part 2 is sharded across processes
+    parallel_threshold = 1000
+    max_workers = None
+
+    def parse(self, puzzle_input):
+        input_grid = puzzle_input.grid()
+        grid = [list(row) for row in input_grid.rows()]
+        start_y, start_x = input_grid.find('^')
+        grid[start_y][start_x] = '.'
+        return grid, start_x, start_y
+
+    def solve(self, data, part, test=False):
+        grid, start_x, start_y = data
+        width = len(grid[0])
+        stops = build_stops(grid)
+
+        visited_squares, entries = self.run_maze(grid, stops, start_x, start_y)
+
+        if part == 1:
+            self.reporter.result(len(visited_squares))
+            return len(visited_squares)
+
+        self.reporter.log(f"Initial run complete, checking {len(visited_squares) - 1} potential obstacle locations...")
+        self.reporter.total(len(visited_squares) - 1)
+        # The guard's path only changes once it first runs into the obstacle, so start just before that
+        candidates = [(x, y) + entry for (x, y), entry in entries.items()]
+        with self.span('obstacles'):
+            if len(candidates) < self.parallel_threshold:
+                return self.count_loops(stops, width, candidates)
+            return self.count_loops_parallel(grid, candidates)
+
+    def count_loops(self, stops, width, candidates):
+        results = 0
+        for x, y, previous_x, previous_y, facing in candidates:
+            if loops_with_obstacle(stops, width, previous_x, previous_y, facing, x, y):
+                results += 1
+                self.reporter.result(results)
+            self.reporter.advance()
+        return results
+
+    def count_loops_parallel(self, grid, candidates):
+        from concurrent.futures import as_completed
+        from multiprocessing import shared_memory
+
+        width = len(grid[0])
+        height = len(grid)
+        workers = worker_count(self.max_workers)
+        # A few shards per worker so progress keeps moving, dealt out round robin to even out the cost
+        shard_count = workers * 4
+        shards = [candidates[i::shard_count] for i in range(shard_count)]
+
+        self.reporter.log(f"Sharding across {workers} worker processes...")
+        # Creating shared memory can start the resource tracker process, which needs a real
+        # stderr to inherit and the UI has sys.stderr captured
+        stderr, sys.stderr = sys.stderr, sys.__stderr__
+        try:
+            shared = shared_memory.SharedMemory(create=True, size=width * height)
+        finally:
+            sys.stderr = stderr
+        try:
+            shared.buf[:width * height] = ''.join(''.join(row) for row in grid).encode()
+            results = 0
+            with process_pool(workers) as executor:
+                futures = {executor.submit(count_loops, shared.name, width, height, shard): len(shard) for shard in shards if shard}
+                for future in as_completed(futures):
+                    results += future.result()
+                    self.reporter.advance(futures[future])
+                    self.reporter.result(results)
+            return results
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def run_maze(self, grid, stops, x, y):
+        """Walks the guard off the map a segment at a time. Returns the visited
+        squares, and for each one but the start, where the guard was and which
+        way it faced just before first stepping onto it."""
+        width = len(grid[0])
+        height = len(grid)
+        facing = 0
+        visited_squares = {(x, y)}
+        entries = {}
+        turns = set()
+
+        while True:
+            stop = next_stop(stops, width, x, y, facing)
+            offset_x, offset_y = offsets[facing]
+            if stop >= 0:
+                stop_y, stop_x = divmod(stop, width)
+                steps = abs(stop_x - x) + abs(stop_y - y)
+            else:
+                steps = [y, width - 1 - x, height - 1 - y, x][facing]
+
+            for _ in range(steps):
+                if (x + offset_x, y + offset_y) not in visited_squares:
+                    visited_squares.add((x + offset_x, y + offset_y))
+                    entries[(x + offset_x, y + offset_y)] = (x, y, facing)
+                x += offset_x
+                y += offset_y
+                if self.reporter.animated:
+                    self.reporter.pause(0.005)
+                    self.reporter.frame(lambda: render_grid(grid, visited_squares, x, y))
+
+            if stop < 0:
+                return visited_squares, entries
+            if stop * 4 + facing in turns:
+                # Walking in circles, and this segment closed the loop so every square on it has been seen
+                return visited_squares, entries
+            turns.add(stop * 4 + facing)
+            facing = (facing + 1) % 4
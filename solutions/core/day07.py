@@ -0,0 +1,164 @@
+from solutions.core.base_solver import BaseSolver
+from solutions.core.parallel import process_pool
+
+
+class Operator:
+    """A binary operator the equation search can undo. `applies(target,
+    operand)` says whether target could be the result of applying it with
+    operand last, and `inverse(target, operand)` gives what it was applied to.
+    `monotone` operators never give a result of 0 or less from positive
+    numbers; the search only prunes on that when every operator in the set is."""
+
+    def __init__(self, symbol, inverse, applies, monotone=False):
+        self.symbol = symbol
+        self.inverse = inverse
+        self.applies = applies
+        self.monotone = monotone
+
+    def compile(self, operand):
+        # Bound to one operand up front, returns the previous target or None
+        inverse = self.inverse
+        applies = self.applies
+        return lambda target: inverse(target, operand) if applies(target, operand) else None
+
+
+class Concat(Operator):
+    """Concatenation of digits in any base, undone with a power of the base
+    instead of string slicing. Only defined for positive targets."""
+
+    def __init__(self, symbol='||', base=10):
+        super().__init__(symbol, self.inverse, self.applies, monotone=True)
+        self.base = base
+
+    def shift(self, operand):
+        # Smallest power of the base above operand, what a concatenated number gets shifted by
+        power = self.base
+        while power <= operand:
+            power *= self.base
+        return power
+
+    def applies(self, target, operand, power=None):
+        return target > 0 and target != operand and target % (power or self.shift(operand)) == operand
+
+    def inverse(self, target, operand, power=None):
+        return target // (power or self.shift(operand))
+
+    def compile(self, operand):
+        # Same as Operator.compile, with the shift worked out once
+        power = self.shift(operand)
+        inverse = self.inverse
+        applies = self.applies
+        return lambda target: inverse(target, operand, power) if applies(target, operand, power) else None
+
+
+operators = {}
+
+
+def register_operator(operator):
+    # Worker processes look operators up by symbol, so register them at import time
+    operators[operator.symbol] = operator
+    return operator
+
+
+register_operator(Operator('+', lambda target, operand: target - operand, lambda target, operand: True, monotone=True))
+register_operator(Operator('*', lambda target, operand: target // operand, lambda target, operand: operand and target % operand == 0, monotone=True))
+register_operator(Concat('||'))
+register_operator(Operator('-', lambda target, operand: target + operand, lambda target, operand: True))
+register_operator(Operator('^', lambda target, operand: target ^ operand, lambda target, operand: True))
+
+
+def can_solve(target, numbers, steps, count, monotone=False):
+    """Works backwards from the target through numbers[:count], undoing the last
+    operator at each step, so no intermediate lists are built. steps[i] holds
+    the compiled inverses for numbers[i]. With `monotone`, a target of 0 or less
+    before the first number is a dead end."""
+    if count == 1:
+        return target == numbers[0]
+    if monotone and target <= 0:
+        return False
+    for undo in steps[count - 1]:
+        previous = undo(target)
+        if previous is not None and can_solve(previous, numbers, steps, count - 1, monotone):
+            return True
+    return False
+
+
+class Equation:
+    __slots__ = ('solution', 'numbers')
+
+    def __init__(self, solution, numbers):
+        self.solution = solution
+        self.numbers = numbers
+
+    @classmethod
+    def from_input(cls, input_line):
+        solution_str, numbers_str = input_line.split(': ')
+        return cls(int(solution_str), [int(x) for x in numbers_str.split(' ')])
+
+    def can_solve(self, operator_set):
+        if not self.numbers:
+            return False
+        # The first number is never an operand, so it needs no inverses
+        steps = [()] + [[operator.compile(number) for operator in operator_set] for number in self.numbers[1:]]
+        monotone = all(operator.monotone for operator in operator_set)
+        return can_solve(self.solution, self.numbers, steps, len(self.numbers), monotone)
+
+
+def load_equations(lines):
+    equations = []
+    for line in lines:
+        equations.append(Equation.from_input(line))
+    return equations
+
+
+def solvable(equations, symbols):
+    operator_set = [operators[symbol] for symbol in symbols]
+    return [equation.can_solve(operator_set) for equation in equations]
+
+
+def solvable_batch(equations, symbols, max_workers=None, chunk_size=500):
+    """Checks equations across a process pool. Yields (offset, results) for
+    each chunk of equations as it finishes, results being solvable() of
+    equations[offset:offset + chunk_size]."""
+    from concurrent.futures import as_completed
+
+    with process_pool(max_workers) as executor:
+        futures = {
+            executor.submit(solvable, equations[offset:offset + chunk_size], symbols): offset
+            for offset in range(0, len(equations), chunk_size)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+class Day07Solver(BaseSolver):
+    version = 2
+    # Operator symbols per part, most restrictive first so dead ends are found sooner
+    operator_sets = {1: ['*', '+'], 2: ['||', '*', '+']}
+    # Equations needed before they're checked across processes
+    parallel_threshold = 5000
+    max_workers = None
+
+    def parse(self, puzzle_input):
+        return load_equations(puzzle_input.iter_lines())
+
+    def solve(self, equations, part, test=False):
+        symbols = self.operator_sets[part]
+        if len(equations) < self.parallel_threshold:
+            operator_set = [operators[symbol] for symbol in symbols]
+            batches = ((offset, [equation.can_solve(operator_set)]) for offset, equation in enumerate(equations))
+        else:
+            self.reporter.log(f"Checking {len(equations)} equations across worker processes...")
+            batches = solvable_batch(equations, symbols, self.max_workers)
+
+        result = 0
+        self.reporter.total(len(equations))
+        for offset, results in batches:
+            for equation, can_solve in zip(equations[offset:offset + len(results)], results):
+                self.reporter.log(f"Solution {'found' if can_solve else 'not found'} for {equation.solution}: {equation.numbers}")
+                if can_solve:
+                    result += equation.solution
+                    self.reporter.result(result)
+                self.reporter.advance()
+                self.reporter.pause(0.05)
+        return result
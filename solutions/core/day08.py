@@ -0,0 +1,94 @@
+from itertools import combinations
+from math import gcd
+
+from solutions.core.base_solver import BaseSolver
+
+
+def inside_rect(position, width, height):
+    return 0 <= position[0] < width and 0 <= position[1] < height
+
+
+def initial_display(width, height, antenna_reverse_lookup):
+    # The grid as it's drawn, one byte per cell plus newlines, updated as antinodes are found
+    display = bytearray((b"." * width + b"\n") * height)
+    for (x, y), char in antenna_reverse_lookup.items():
+        display[y * (width + 1) + x] = ord(char)
+    return display
+
+
+class Day08Solver(BaseSolver):
+    def parse(self, puzzle_input):
+        antennas = {}
+        antenna_reverse_lookup = {}
+        y = 0
+        width = 0
+        for line in puzzle_input.iter_lines():
+            width = len(line)
+            x = 0
+            for char in line:
+                if char == ".":
+                    x += 1
+                    continue
+                if not char in antennas:
+                    antennas[char] = []
+                antennas[char].append((x, y))
+                antenna_reverse_lookup[(x, y)] = char
+                x += 1
+            y += 1
+        height = y
+        return antennas, antenna_reverse_lookup, width, height
+
+    def solve(self, data, part, test=False):
+        antennas, antenna_reverse_lookup, width, height = data
+
+        antenna_pairs = list(map(lambda a: (a, list(combinations(antennas[a], 2))), antennas.keys()))
+        total_antenna_pairs = sum(len(x[1]) for x in antenna_pairs)
+
+        self.reporter.total(total_antenna_pairs)
+        # One byte per cell, set once a cell is an antinode, with a running count of set cells
+        antinodes = bytearray(width * height)
+        unique_antinodes = 0
+        display = initial_display(width, height, antenna_reverse_lookup)
+
+        def add_antinode(x, y):
+            nonlocal unique_antinodes
+            if not antinodes[y * width + x]:
+                antinodes[y * width + x] = 1
+                unique_antinodes += 1
+                display[y * (width + 1) + x] = ord("#")
+
+        for antenna_pairs_set in antenna_pairs:
+            for antenna_pair in antenna_pairs_set[1]:
+                x_offset = antenna_pair[0][0] - antenna_pair[1][0]
+                y_offset = antenna_pair[0][1] - antenna_pair[1][1]
+
+                added_antinode = False
+                if part == 1:
+                    first_position = (antenna_pair[0][0] + x_offset, antenna_pair[0][1] + y_offset)
+                    second_position = (antenna_pair[1][0] - x_offset, antenna_pair[1][1] - y_offset)
+                    if inside_rect(first_position, width, height):
+                        added_antinode = True
+                        add_antinode(*first_position)
+                    if inside_rect(second_position, width, height):
+                        added_antinode = True
+                        add_antinode(*second_position)
+                else:
+                    # Step by the smallest whole-cell offset, so every cell on the line is hit
+                    divisor = gcd(x_offset, y_offset)
+                    x_step = x_offset // divisor
+                    y_step = y_offset // divisor
+                    added_antinode = True
+                    for direction in (1, -1):
+                        x, y = antenna_pair[0]
+                        while inside_rect((x, y), width, height):
+                            add_antinode(x, y)
+                            x += x_step * direction
+                            y += y_step * direction
+
+                if added_antinode:
+                    self.reporter.result(unique_antinodes)
+                    self.reporter.frame(lambda: display.decode())
+                    self.reporter.pause(0.05)
+                self.reporter.advance()
+
+        return unique_antinodes
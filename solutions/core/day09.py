@@ -0,0 +1,109 @@
+from array import array
+from heapq import heappop, heappush
+
+from solutions.core.base_solver import BaseSolver
+
+
+def disk_str(disk):
+    return ''.join(format(id, 'x') if id >= 0 else '.' for id in disk)
+
+
+class Day09Solver(BaseSolver):
+    def parse(self, puzzle_input):
+        return puzzle_input.text().strip()
+
+    def solve(self, input, part, test=False):
+        if part == 1:
+            with self.span('compact'):
+                return self.compact(input)
+
+        self.reporter.log("Defragmenting")
+        with self.span('defragment'):
+            file_starts, file_sizes, length = self.move_files(input)
+
+        if len(input) < 30:
+            disk = array('i', [-1]) * length
+            for file_id, (start, size) in enumerate(zip(file_starts, file_sizes)):
+                disk[start:start + size] = array('i', [file_id]) * size
+            self.reporter.log(disk_str(disk))
+
+        self.reporter.log("Done defragmenting, calculating checksum")
+
+        with self.span('checksum'):
+            checksum = sum(
+                file_id * (start * size + size * (size - 1) // 2)
+                for file_id, (start, size) in enumerate(zip(file_starts, file_sizes))
+            )
+        self.reporter.result(checksum)
+        return checksum
+
+    def compact(self, disk_map):
+        """Expands the disk map to one file id per block (-1 for free space), then
+        fills free blocks from the end of the disk with two pointers, adding up
+        the checksum as each block settles."""
+        disk = array('i')
+        for index, size in enumerate(map(int, disk_map)):
+            disk.extend(array('i', [index // 2 if index % 2 == 0 else -1]) * size)
+        if len(disk_map) < 30:
+            self.reporter.log(disk_str(disk))
+
+        self.reporter.log("Defragmenting")
+        self.reporter.total(disk.count(-1))
+        checksum = 0
+        moved = 0
+        left = 0
+        right = len(disk) - 1
+        while left <= right:
+            if disk[left] == -1:
+                while right > left and disk[right] == -1:
+                    right -= 1
+                if right == left:
+                    break
+                disk[left] = disk[right]
+                disk[right] = -1
+                right -= 1
+                moved += 1
+            checksum += left * disk[left]
+            left += 1
+
+        if len(disk_map) < 30:
+            self.reporter.log(disk_str(disk))
+        self.reporter.advance(moved)
+        self.reporter.result(checksum)
+        return checksum
+
+    def move_files(self, disk_map):
+        """Moves each file, highest id first, to the leftmost free span that fits
+        it. Free spans are indexed by length, one min-heap of start offsets per
+        length, so finding a span means looking at 9 heap tops. Returns the
+        file start offsets, sizes and the disk length."""
+        file_starts = array('l')
+        file_sizes = array('b')
+        free_spans = [[] for _ in range(10)]
+        position = 0
+        for index, size in enumerate(map(int, disk_map)):
+            if index % 2 == 0:
+                file_starts.append(position)
+                file_sizes.append(size)
+            elif size:
+                # Offsets only grow, so each list is already a valid heap
+                free_spans[size].append(position)
+            position += size
+
+        self.reporter.total(len(file_starts))
+        for file_id in range(len(file_starts) - 1, -1, -1):
+            size = file_sizes[file_id]
+            best_start = file_starts[file_id]
+            best_length = 0
+            for length in range(max(size, 1), 10):
+                if free_spans[length] and free_spans[length][0] < best_start:
+                    best_start = free_spans[length][0]
+                    best_length = length
+            if best_length:
+                heappop(free_spans[best_length])
+                file_starts[file_id] = best_start
+                if best_length > size:
+                    heappush(free_spans[best_length - size], best_start + size)
+            # The space the file leaves is right of every file still to move, so it's never reused
+            self.reporter.advance()
+        return file_starts, file_sizes, position
@@ -0,0 +1,59 @@
+from array import array
+
+from solutions.core.base_solver import BaseSolver
+
+
+def count_trails(grid):
+    """Walks the heights from 9 down to 0 once. Returns, per cell in row-major
+    order, the rating (number of trails up to a 9) and the score as a bitset of
+    which 9s can be reached."""
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
+    levels = [[] for _ in range(10)]
+    for y in range(height):
+        for x in range(width):
+            levels[grid[y][x]].append((y, x))
+
+    ratings = array('q', [0]) * (width * height)
+    reachable = [0] * (width * height)
+    for bit, (y, x) in enumerate(levels[9]):
+        ratings[y * width + x] = 1
+        reachable[y * width + x] = 1 << bit
+
+    for level in range(8, -1, -1):
+        for y, x in levels[level]:
+            cell = y * width + x
+            for next_y, next_x in ((y + 1, x), (y, x + 1), (y - 1, x), (y, x - 1)):
+                if 0 <= next_y < height and 0 <= next_x < width and grid[next_y][next_x] == level + 1:
+                    ratings[cell] += ratings[next_y * width + next_x]
+                    reachable[cell] |= reachable[next_y * width + next_x]
+    return ratings, reachable
+
+
+class Day10Solver(BaseSolver):
+    def parse(self, puzzle_input):
+        return [[int(c) for c in row] for row in puzzle_input.grid().rows()]
+
+    def solve(self, grid, part, test=False):
+        starts = []
+        for y in range(0, len(grid)):
+            for x in range(0, len(grid[0])):
+                if grid[y][x] == 0:
+                    starts.append((y, x))
+
+        ratings, reachable = count_trails(grid)
+
+        self.reporter.total(len(starts))
+        self.reporter.log(f"Examining {len(starts)} starts")
+        results = 0
+        for start in starts:
+            cell = start[0] * len(grid[0]) + start[1]
+            trailhead_score = reachable[cell].bit_count() if part == 1 else ratings[cell]
+            results += trailhead_score
+            self.reporter.log(
+                f"Start {start} has {trailhead_score} trails"
+            )
+            self.reporter.result(results)
+            self.reporter.advance()
+            self.reporter.pause(0.05)
+        return results
@@ -0,0 +1,125 @@
+import hashlib
+import os
+import pickle
+import sys
+from collections import defaultdict
+
+from solutions.core.base_solver import BaseSolver
+
+
+DEFAULT_DIRECTORY = os.path.join('.aoc-cache', 'transitions')
+
+
+def digit_count(value):
+    count = 1
+    power = 10
+    while power <= value:
+        power *= 10
+        count += 1
+    return count
+
+
+def blink(stone):
+    if stone == 0:
+        return (1,)
+    digits = digit_count(stone)
+    if digits % 2 == 0:
+        return divmod(stone, 10 ** (digits // 2))
+    return (stone * 2024,)
+
+
+def transitions_path(rules, directory=DEFAULT_DIRECTORY):
+    """Where the transition table for `rules` is kept, named after the function
+    and a hash of its module's source, so editing the rules or their helpers
+    starts a new table. None for rules that can't be named reliably, like
+    lambdas and nested functions, which are never persisted."""
+    module = sys.modules.get(rules.__module__)
+    if '<' in rules.__qualname__ or not getattr(module, '__file__', None):
+        return None
+    with open(module.__file__, 'rb') as source_file:
+        digest = hashlib.sha256(source_file.read()).hexdigest()
+    return os.path.join(directory, f"{rules.__module__}.{rules.__qualname__}-{digest}.pickle")
+
+
+class TransitionTable:
+    """What each stone turns into after one blink under a rule set, loaded
+    from and saved to `path` so later runs start warm. At most `max_entries`
+    stones are remembered; any past that are worked out every time."""
+
+    def __init__(self, rules, path=None, max_entries=1_000_000):
+        self.rules = rules
+        self.path = path
+        self.max_entries = max_entries
+        self.transitions = {}
+        self.added = 0
+        if path:
+            try:
+                with open(path, 'rb') as table_file:
+                    self.transitions = pickle.load(table_file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+    def __getitem__(self, stone):
+        next_stones = self.transitions.get(stone)
+        if next_stones is None:
+            next_stones = tuple(self.rules(stone))
+            if len(self.transitions) < self.max_entries:
+                self.transitions[stone] = next_stones
+                self.added += 1
+        return next_stones
+
+    def save(self):
+        if not self.path or not self.added:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as table_file:
+            pickle.dump(self.transitions, table_file, protocol=5)
+        os.replace(temp_path, self.path)
+        self.added = 0
+        # Tables for earlier versions of the same rules will never be read again
+        prefix = os.path.basename(self.path).rpartition('-')[0] + '-'
+        for name in os.listdir(os.path.dirname(self.path)):
+            if name.startswith(prefix) and name.endswith('.pickle') and name != os.path.basename(self.path):
+                try:
+                    os.remove(os.path.join(os.path.dirname(self.path), name))
+                except FileNotFoundError:
+                    pass
+
+
+def evolve(stones, table, blinks):
+    """Blinks a {stone: count} multiset, one generation at a time. Only distinct
+    stones are held, however many there are in total."""
+    for _ in range(blinks):
+        next_stones = defaultdict(int)
+        for stone, count in stones.items():
+            for next_stone in table[stone]:
+                next_stones[next_stone] += count
+        stones = next_stones
+        yield stones
+
+
+class Day11Solver(BaseSolver):
+    # Maps a stone to the stones it becomes, swap it for other rule sets
+    rules = staticmethod(blink)
+
+    def parse(self, puzzle_input):
+        return [int(x) for x in puzzle_input.text().split()]
+
+    def solve(self, values, part, test=False):
+        blinks = 25 if part == 1 else 75
+        # Only touch the disk when caching is on for this run
+        table = TransitionTable(self.rules, transitions_path(self.rules) if self.parse_cache is not None else None)
+        stones = defaultdict(int)
+        for value in values:
+            stones[value] += 1
+
+        total_rocks = len(values)
+        self.reporter.total(blinks)
+        for stones in evolve(stones, table, blinks):
+            total_rocks = sum(stones.values())
+            self.reporter.advance()
+            self.reporter.result(total_rocks)
+        self.reporter.log(f"{len(stones)} distinct stones after {blinks} blinks")
+        table.save()
+        return total_rocks
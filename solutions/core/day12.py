@@ -0,0 +1,98 @@
+from enum import Enum
+from collections import namedtuple
+
+from solutions.core.base_solver import BaseSolver
+
+
+Coord = namedtuple('Coord', ['row', 'col'])
+Edge = namedtuple('Edge', ['coord', 'side'])
+
+class Side(Enum):
+    TOP = 0
+    RIGHT = 1
+    BOTTOM = 2
+    LEFT = 3
+
+def get_adjacent(coord):
+    x, y = coord
+    return [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+
+def is_available(processed, coord):
+    x, y = coord
+    return 0 <= x < len(processed[0]) and 0 <= y < len(processed) and not processed[x][y]
+
+def get_edges(region):
+    edges = []
+    for coord in region:
+        if (coord[0] - 1, coord[1]) not in region:
+            edges.append(Edge(coord, Side.TOP))
+        if (coord[0] + 1, coord[1]) not in region:
+            edges.append(Edge(coord, Side.BOTTOM))
+        if (coord[0], coord[1] - 1) not in region:
+            edges.append(Edge(coord, Side.LEFT))
+        if (coord[0], coord[1] + 1) not in region:
+            edges.append(Edge(coord, Side.RIGHT))
+    return edges
+
+def calculate_perimeter(region):
+    return len(get_edges(region))
+
+def count_sides(region):
+    edges = get_edges(region)
+    sides = 0
+    for edge in edges:
+        if edge.side == Side.TOP or edge.side == Side.BOTTOM:
+            left = (edge.coord[0], edge.coord[1] - 1)
+            if (left, edge.side) not in edges:
+                sides += 1
+        if edge.side == Side.LEFT or edge.side == Side.RIGHT:
+            top = (edge.coord[0] - 1, edge.coord[1])
+            if (top, edge.side) not in edges:
+                sides += 1
+    return sides
+
+def find_region(grid, processed, row, col):
+    region = set([(row, col)])
+    processed[row][col] = True
+    frontier = get_adjacent((row, col))
+    while len(frontier) > 0:
+        next = frontier.pop()
+
+        if not is_available(processed, next):
+            continue
+        if grid[next[0]][next[1]] != grid[row][col]:
+            continue
+
+        processed[next[0]][next[1]] = True
+        region.add(next)
+        frontier.extend(get_adjacent(next))
+    return region
+
+
+class Day12Solver(BaseSolver):
+    def parse(self, puzzle_input):
+        return [list(row) for row in puzzle_input.grid().rows()]
+
+    def solve(self, grid, part, test=False):
+        processed = [[False for _ in row] for row in grid]
+        regions = []
+        self.reporter.total(len(grid) * len(grid[0]))
+        with self.span('regions'):
+            for row in range(0, len(grid)):
+                for col in range(0, len(grid[row])):
+                    if not processed[row][col]:
+                        regions.append(find_region(grid, processed, row, col))
+                    self.reporter.advance()
+
+        result = 0
+        with self.span('pricing'):
+            for region in regions:
+                root = next(iter(region))
+                region_id = grid[root[0]][root[1]]
+                size = len(region)
+                mult = calculate_perimeter(region) if part == 1 else count_sides(region)
+                cost = size * mult
+                self.reporter.log(f"Region {region_id} will cost {size} x {mult} = {cost}")
+                result += cost
+                self.reporter.result(result)
+        return result
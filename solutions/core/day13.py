@@ -0,0 +1,42 @@
+import re
+
+from solutions.core.base_solver import BaseSolver
+
+
+number_regex = re.compile(r'(\d+)')
+
+
+class Problem:
+    __slots__ = ('button_a_x', 'button_a_y', 'button_b_x', 'button_b_y', 'prize_x', 'prize_y')
+
+    def __init__(self, input, offset):
+        lines = input.split('\n')
+        (self.button_a_x, self.button_a_y) = map(int, number_regex.findall(lines[0]))
+        (self.button_b_x, self.button_b_y) = map(int, number_regex.findall(lines[1]))
+        (self.prize_x, self.prize_y) = map(lambda x: int(x) + offset, number_regex.findall(lines[2]))
+    
+    def solve(self):
+        b_presses = (((self.prize_x * self.button_a_y) - (self.prize_y * self.button_a_x)) /
+                ((self.button_b_x * self.button_a_y) - (self.button_b_y * self.button_a_x)));
+        a_presses = (self.prize_x - (self.button_b_x * b_presses)) / self.button_a_x;
+        return a_presses, b_presses
+
+
+class Day13Solver(BaseSolver):
+    def parse(self, puzzle_input):
+        return list(puzzle_input.iter_sections())
+
+    def solve(self, puzzle_inputs, part, test=False):
+        total_cost = 0
+        for puzzle_input in puzzle_inputs:
+            problem = Problem(puzzle_input, 0 if part == 1 else 10000000000000)
+            self.reporter.log(f"Problem: AX={problem.button_a_x}, AY={problem.button_a_y}, BX={problem.button_b_x}, BY={problem.button_b_y}, PX={problem.prize_x}, PY={problem.prize_y}")
+            a_presses, b_presses = problem.solve()
+            if a_presses == int(a_presses) and b_presses == int(b_presses):
+                cost = int(a_presses) * 3 + int(b_presses)
+                total_cost += cost
+                self.reporter.log(f"  Solution: A={a_presses}, B={b_presses} (costs {cost})")
+                self.reporter.result(total_cost)
+            else:
+                self.reporter.log("  No solution")
+        return total_cost
@@ -0,0 +1,88 @@
+import re
+
+from solutions.core.base_solver import BaseSolver
+from solutions.core.records import Columns
+
+
+number_regex = re.compile(r'(-?\d+)')
+
+
+def get_positions(robots, steps, width, height):
+    xs = [(x + vx * steps) % width for x, vx in zip(robots.pos_x, robots.vel_x)]
+    ys = [(y + vy * steps) % height for y, vy in zip(robots.pos_y, robots.vel_y)]
+    return zip(xs, ys)
+
+
+def get_quadrant(x, y, width, height):
+    if x < width // 2 and y < height // 2:
+        return 0
+    elif x > width // 2 and y < height // 2:
+        return 1
+    elif x < width // 2 and y > height // 2:
+        return 2
+    elif x > width // 2 and y > height // 2:
+        return 3
+    else:
+        return None
+
+
+def flood_count(start_x, start_y, positions):
+    valid_positions = set(positions)
+    frontier = [(start_x, start_y)]
+    total = 0
+    while frontier:
+        (x, y) = frontier.pop()
+        if (x, y) in valid_positions:
+            total += 1
+            valid_positions.remove((x, y))
+            frontier.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
+    return total
+
+
+class Day14Solver(BaseSolver):
+    version = 2
+
+    def parse(self, puzzle_input):
+        robots = Columns('l', 'pos_x', 'pos_y', 'vel_x', 'vel_y')
+        for line in puzzle_input.iter_lines():
+            robots.append(*map(int, number_regex.findall(line)))
+        return robots
+
+    def solve(self, robots, part, test=False):
+        steps = 100
+        width = 11 if test else 101
+        height = 7 if test else 103
+
+        if part == 1:
+            self.reporter.total(len(robots))
+            quadrants = [0, 0, 0, 0]
+            for x, y in get_positions(robots, steps, width, height):
+                quadrant = get_quadrant(x, y, width, height)
+                if quadrant is not None:
+                    quadrants[quadrant] += 1
+                self.reporter.advance()
+
+            safety_factor = quadrants[0] * quadrants[1] * quadrants[2] * quadrants[3]
+            self.reporter.result(safety_factor)
+            return safety_factor
+
+        max_search_time = 10_000
+        self.reporter.total(max_search_time)
+        for steps in range(0, max_search_time):
+            positions = set(get_positions(robots, steps, width, height))
+
+            largest_flood = 0
+            for position in positions:
+                pattern_size = flood_count(position[0], position[1], positions)
+                largest_flood = max(largest_flood, pattern_size)
+
+            if largest_flood > 50:
+                self.reporter.log("Pattern found at step " + str(steps))
+                grid = [[(x, y) in positions for x in range(width)] for y in range(height)]
+                grid_chars = [['#' if x else '.' for x in row] for row in grid]
+                for row in grid_chars:
+                    self.reporter.log(''.join(row))
+                self.reporter.result(steps)
+                return steps
+            self.reporter.advance()
+        return None
@@ -0,0 +1,17 @@
+import os
+
+
+def worker_count(max_workers=None):
+    return max_workers or os.cpu_count()
+
+
+def process_pool(max_workers=None):
+    """Process pool for splitting up one solver's work. Workers are spawned
+    rather than forked, because the UI runs solvers from a thread. Spawning
+    costs tens of milliseconds per worker, so solvers only reach for this above
+    their `parallel_threshold`. Imports are deferred to keep multiprocessing
+    off runs that never get that big."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=worker_count(max_workers), mp_context=multiprocessing.get_context('spawn'))
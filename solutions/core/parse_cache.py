@@ -0,0 +1,73 @@
+import os
+import pickle
+
+
+DEFAULT_DIRECTORY = os.path.join('.aoc-cache', 'parsed')
+
+
+class ParseCache:
+    """On-disk cache of parsed puzzle inputs, keyed by the input's content
+    hash and the solver's version. Least recently used entries are evicted
+    once the cache grows past `max_bytes`."""
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, solver, puzzle_input):
+        return f"{type(solver).__name__}-v{solver.version}-{puzzle_input.digest()}"
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key):
+        try:
+            with open(self.path(key), 'rb') as cache_file:
+                data = pickle.load(cache_file)
+        except OSError:
+            return False, None
+        except Exception:
+            # Unpickling runs arbitrary code paths, so anything can come out of a stale or
+            # corrupt entry, e.g. a class renamed or given __slots__ without a version bump
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+            return False, None
+        # Bump the modification time, it's what eviction orders by
+        os.utime(self.path(key))
+        return True, data
+
+    def put(self, key, data):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{self.path(key)}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(data, cache_file, protocol=5)
+        os.replace(temp_path, self.path(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pickle'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def load(self, solver, puzzle_input):
+        key = self.key(solver, puzzle_input)
+        hit, data = self.get(key)
+        if hit:
+            solver.reporter.log("Loaded parsed input from cache")
+            return data
+        data = solver.parse(puzzle_input)
+        self.put(key, data)
+        return data
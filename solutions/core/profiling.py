@@ -0,0 +1,70 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+
+DEFAULT_DIRECTORY = 'profiles'
+
+
+def frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """Profiles the calling thread with cProfile, while a background thread
+    samples its stack for collapsed-stack (flamegraph) output. Writes
+    `<name>.prof` and `<name>.collapsed` when the block exits."""
+
+    def __init__(self, name, directory=DEFAULT_DIRECTORY, interval=0.005):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        self.prof_path = os.path.join(directory, f"{name}-{stamp}.prof")
+        self.collapsed_path = os.path.join(directory, f"{name}-{stamp}.collapsed")
+        self.interval = interval
+        self.profile = cProfile.Profile()
+        self.samples = Counter()
+        self.stopped = threading.Event()
+
+    def __enter__(self):
+        self.thread_id = threading.get_ident()
+        self.sampler = threading.Thread(target=self.sample, daemon=True)
+        self.sampler.start()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.stopped.set()
+        self.sampler.join()
+        self.write()
+
+    def sample(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def write(self):
+        os.makedirs(os.path.dirname(self.prof_path) or '.', exist_ok=True)
+        self.profile.dump_stats(self.prof_path)
+        with open(self.collapsed_path, 'w') as collapsed_file:
+            for stack, count in self.samples.most_common():
+                collapsed_file.write(f"{stack} {count}\n")
+
+    def top_functions(self, count=15):
+        stats = pstats.Stats(self.profile).stats
+        hottest = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:count]
+        lines = [f"{'self':>10} {'cumulative':>11} {'calls':>9}  function"]
+        for (file_name, line, name), (_, calls, self_time, cumulative_time, _) in hottest:
+            lines.append(
+                f"{self_time * 1000:8.1f}ms {cumulative_time * 1000:9.1f}ms {calls:>9}  "
+                f"{name} ({os.path.basename(file_name)}:{line})"
+            )
+        return lines
@@ -0,0 +1,105 @@
+import hashlib
+import mmap
+import os
+
+
+def content_end(data):
+    # Index just past the last character, ignoring trailing newlines
+    end = len(data)
+    while end > 0 and data[end - 1] == 10:
+        end -= 1
+    return end
+
+
+class Grid:
+    """Read-only view of a rectangular puzzle input, indexed straight out of
+    the file buffer. Rows are `stride` bytes apart (the width plus the line
+    ending)."""
+
+    def __init__(self, data):
+        self.data = data
+        first_newline = data.find(b'\n')
+        if first_newline == -1:
+            first_newline = len(data)
+        self.width = first_newline
+        self.stride = first_newline + 1
+        self.height = (content_end(data) + 1) // self.stride if self.width else 0
+
+    def __getitem__(self, position):
+        row, col = position
+        return chr(self.data[row * self.stride + col])
+
+    def row(self, row):
+        start = row * self.stride
+        return self.data[start:start + self.width].decode()
+
+    def rows(self):
+        return [self.row(row) for row in range(self.height)]
+
+    def find(self, char):
+        index = self.data.find(char.encode())
+        if index == -1:
+            return None
+        return divmod(index, self.stride)
+
+
+class PuzzleInput:
+    """A puzzle input file, memory-mapped once and read through iterators so
+    large inputs aren't copied into intermediate lists of strings."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size:
+                self.data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Empty files can't be mapped
+                self.data = b''
+        first_newline = self.data.find(b'\n')
+        if first_newline > 0 and self.data[first_newline - 1] == 13:
+            # CRLF checkouts get one LF copy, so everything below only deals with b'\n'
+            crlf_data = self.data
+            self.data = crlf_data[:].replace(b'\r\n', b'\n')
+            crlf_data.close()
+        self.view = memoryview(self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def digest(self):
+        return hashlib.sha256(self.data).hexdigest()
+
+    def text(self):
+        return str(self.view, 'utf-8')
+
+    def iter_split(self, separator):
+        data = self.data
+        end = content_end(data)
+        start = 0
+        while start < end:
+            found = data.find(separator, start, end)
+            if found == -1:
+                found = end
+            yield str(self.view[start:found], 'utf-8')
+            start = found + len(separator)
+
+    def iter_chunks(self, size):
+        for start in range(0, len(self.data), size):
+            yield self.view[start:start + size]
+
+    def iter_lines(self):
+        return self.iter_split(b'\n')
+
+    def iter_sections(self):
+        return self.iter_split(b'\n\n')
+
+    def grid(self):
+        return Grid(self.data)
@@ -0,0 +1,22 @@
+from array import array
+
+
+class Columns:
+    """Struct-of-arrays storage for many small records of numbers: one typed
+    array per field instead of one object per record. Fields are attributes
+    holding the whole column, so bulk work can zip over them directly."""
+
+    def __init__(self, typecode, *fields):
+        self.fields = fields
+        for field in fields:
+            setattr(self, field, array(typecode))
+
+    def __len__(self):
+        return len(getattr(self, self.fields[0])) if self.fields else 0
+
+    def __iter__(self):
+        return zip(*(getattr(self, field) for field in self.fields))
+
+    def append(self, *values):
+        for field, value in zip(self.fields, values):
+            getattr(self, field).append(value)
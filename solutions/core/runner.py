@@ -0,0 +1,118 @@
+import importlib
+import os
+import time
+
+from solutions.core.answer_store import AnswerStore, source_digest
+from solutions.core.arguments import day_str, input_file_name
+from solutions.core.base_solver import Instrumentation
+from solutions.core.parse_cache import ParseCache
+from solutions.core.puzzle_input import PuzzleInput
+
+
+def implemented_days():
+    core_dir = os.path.dirname(__file__)
+    return sorted(
+        int(name[3:5]) for name in os.listdir(core_dir)
+        if name.startswith('day') and name.endswith('.py')
+    )
+
+
+def load_solver(day, reporter=None, parse_cache=None, instrumentation=None):
+    module = importlib.import_module(f'solutions.core.day{day_str(day)}')
+    return getattr(module, f'Day{day_str(day)}Solver')(reporter, parse_cache, instrumentation)
+
+
+def solve_headless(solver, puzzle_input, day, part, test, timings_path=None):
+    result = solver.run(puzzle_input, part, test)
+    instrumentation = solver.instrumentation
+    if timings_path:
+        instrumentation.write(timings_path, day=day, part=part, test=test)
+    return {
+        'day': day,
+        'part': part,
+        'test': test,
+        'result': result,
+        'cached': False,
+        'parse_seconds': instrumentation.seconds('parse'),
+        'solve_seconds': instrumentation.seconds('solve'),
+        'seconds': instrumentation.seconds('parse') + instrumentation.seconds('solve'),
+        'phases': list(instrumentation.phases.values()),
+    }
+
+
+def profile_headless(day, part, test, timings_path=None):
+    from solutions.core.profiling import Profiler
+
+    solver = load_solver(day, instrumentation=Instrumentation(trace_memory=bool(timings_path)))
+    with PuzzleInput(input_file_name(day, test)) as puzzle_input:
+        with Profiler(f"day{day_str(day)}-part{part}") as profiler:
+            record = solve_headless(solver, puzzle_input, day, part, test, timings_path)
+    record['profile'] = {
+        'prof': profiler.prof_path,
+        'collapsed': profiler.collapsed_path,
+        'top': profiler.top_functions(),
+    }
+    return record
+
+
+def run_headless(day, part, test, use_cache=True, refresh=False, profile=False, timings_path=None):
+    if profile:
+        # Profile a full parse and solve, not a cache lookup
+        return profile_headless(day, part, test, timings_path)
+    solver = load_solver(
+        day,
+        parse_cache=ParseCache() if use_cache else None,
+        instrumentation=Instrumentation(trace_memory=bool(timings_path)),
+    )
+    with PuzzleInput(input_file_name(day, test)) as puzzle_input:
+        if not use_cache:
+            return solve_headless(solver, puzzle_input, day, part, test, timings_path)
+        key = (day, part, test, puzzle_input.digest(), source_digest(solver))
+        with AnswerStore() as store:
+            start = time.perf_counter()
+            hit, result = store.get(*key)
+            if hit and not refresh:
+                return {
+                    'day': day,
+                    'part': part,
+                    'test': test,
+                    'result': result,
+                    'cached': True,
+                    'seconds': time.perf_counter() - start,
+                }
+            record = solve_headless(solver, puzzle_input, day, part, test, timings_path)
+            store.put(*key, record['result'], record['seconds'])
+            return record
+
+
+def run_batch(days, parts, test, max_workers=None, use_cache=True, refresh=False, profile=False,
+              timings_path=None):
+    # Imported here, multiprocessing is a big chunk of startup for single runs
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(day, part) for day in days for part in parts]
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(run_headless, day, part, test, use_cache, refresh, profile, timings_path): (day, part) for day, part in jobs}
+        for future, (day, part) in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'day': day, 'part': part, 'test': test, 'error': repr(e)})
+    return sorted(results, key=lambda r: (r['day'], r['part']))
+
+
+def format_table(results, elapsed):
+    rows = [('Day', 'Part', 'Result', 'Seconds', '')]
+    for r in results:
+        if 'error' in r:
+            rows.append((str(r['day']), str(r['part']), r['error'], '-', ''))
+        else:
+            rows.append((str(r['day']), str(r['part']), str(r['result']), f"{r['seconds']:.3f}",
+                         'cached' if r['cached'] else ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ['  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    total = sum(r.get('seconds', 0) for r in results)
+    lines.append(f"\n{len(results)} runs, {total:.3f}s of solving in {elapsed:.3f}s wall time")
+    return '\n'.join(lines)
@@ -0,0 +1,38 @@
+import itertools
+import random
+
+from solutions.core.day07 import Equation, operators
+
+
+forward = {
+    '+': lambda left, right: left + right,
+    '*': lambda left, right: left * right,
+    '-': lambda left, right: left - right,
+    '^': lambda left, right: left ^ right,
+    '||': lambda left, right: int(f"{left}{right}"),
+}
+
+
+def brute_force(target, numbers, symbols):
+    for chosen in itertools.product(symbols, repeat=len(numbers) - 1):
+        value = numbers[0]
+        for symbol, number in zip(chosen, numbers[1:]):
+            value = forward[symbol](value, number)
+        if value == target:
+            return True
+    return False
+
+
+def test_mixed_operator_sets():
+    assert Equation(2, [1, 5, 6]).can_solve([operators['+'], operators['-']])
+    assert Equation(0, [1, 1, 5]).can_solve([operators['^'], operators['*']])
+
+
+def test_operator_sets_match_brute_force():
+    random.seed(7)
+    for symbols in (['+', '*'], ['+', '-'], ['^', '*'], ['+', '-', '*', '^'], ['||', '*', '+']):
+        operator_set = [operators[symbol] for symbol in symbols]
+        for _ in range(300):
+            numbers = [random.randint(1, 9) for _ in range(random.randint(1, 5))]
+            target = random.randint(-20, 60)
+            assert Equation(target, numbers).can_solve(operator_set) == brute_force(target, numbers, symbols)
@@ -0,0 +1,77 @@
+import importlib
+import os
+from textual.app import App, ComposeResult
+from textual.containers import Horizontal, HorizontalGroup, VerticalGroup, Center
+from textual.widgets import Button, Footer, Header, ProgressBar, RichLog
+
+from solutions.core.parse_cache import ParseCache
+from solutions.core.arguments import day_str, input_file_name
+
+
+class AoCApp(App):
+    CSS = """
+    .top_margin_1 {
+        margin-top: 1;
+    }
+    .width_auto { 
+        width: auto;
+    }
+    #main_progress_bar {
+        margin-top: 1;
+    }
+    .results_digits {
+        border: double green;
+        width: auto;
+    }
+    """
+    BINDINGS = [("d", "toggle_dark", "Toggle dark mode")]
+
+    def __init__(self, args, widget, input_path, rich_log, progress_bar):
+        super().__init__()
+        self.args = args
+        self.widget = widget
+        self.input_path = input_path
+        self.rich_log = rich_log
+        self.progress_bar = progress_bar
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Footer()
+        with Horizontal():
+            yield self.widget
+            with VerticalGroup():
+                with HorizontalGroup():
+                    with Center():
+                        yield self.progress_bar
+                    yield Button("Run", id="run")
+                yield self.rich_log
+
+    def action_toggle_dark(self) -> None:
+        self.theme = (
+            "textual-dark" if self.theme == "textual-light" else "textual-light"
+        )
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "run":
+            self.widget.run(self.input_path, self.args.part, self.args.test)
+
+
+def run_tui(args):
+    rich_log = RichLog(highlight=True, markup=True)
+    progress_bar = ProgressBar(id="main_progress_bar")
+    try:
+        module = importlib.import_module(f'solutions.day{day_str(args.day)}')
+        widget = getattr(module, f'Day{day_str(args.day)}')(rich_log, progress_bar)
+        widget.parse_cache = None if args.no_cache else ParseCache()
+        widget.profile = args.profile
+        widget.timings_path = args.timings
+    except ModuleNotFoundError:
+        print(f'No implementation for day {args.day} found.')
+        return
+    input_path = input_file_name(args.day, args.test)
+    if not os.path.exists(input_path):
+        print(f"Input file for day {args.day} {'(test) ' if args.test else ''}not found.")
+        return
+
+    app = AoCApp(args, widget, input_path, rich_log, progress_bar)
+    app.run()